@@ -11,6 +11,13 @@ from yappy import main, types
 from . import models
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    main._get_model_options.cache_clear()
+    main._get_field_option.cache_clear()
+    main._create_field_validator.cache_clear()
+
+
 @patch.object(main, "option_from_model_field")
 @patch.object(
     main,
@@ -336,9 +343,10 @@ def test_option_from_model_field(
 
 
 @patch.object(main, "run_model_validator")
-@patch.object(main, "convert_to_shape_type")
-def test_create_field_validator(convert_to_shape_type, run_model_validator):
-    convert_to_shape_type.return_value = sentinel.convert_to_shape_type
+@patch.object(main, "get_shape_converter")
+def test_create_field_validator(get_shape_converter, run_model_validator):
+    converter = get_shape_converter.return_value
+    converter.return_value = sentinel.converter
     run_model_validator.return_value = sentinel.run_model_validator
 
     validator = main.create_field_validator(
@@ -351,12 +359,10 @@ def test_create_field_validator(convert_to_shape_type, run_model_validator):
         value=sentinel.value,
     )
 
-    convert_to_shape_type.assert_called_once_with(
-        sentinel.value,
-        sentinel.model_field,
-    )
+    get_shape_converter.assert_called_once_with(sentinel.model_field)
+    converter.assert_called_once_with(sentinel.value)
     run_model_validator.assert_called_once_with(
-        sentinel.convert_to_shape_type,
+        sentinel.converter,
         sentinel.model_field,
         sentinel.model,
     )
@@ -364,12 +370,13 @@ def test_create_field_validator(convert_to_shape_type, run_model_validator):
 
 
 @patch.object(main, "run_model_validator")
-@patch.object(main, "convert_to_shape_type")
+@patch.object(main, "get_shape_converter")
 def test_create_field_validator_no_apply_field_validator(
-    convert_to_shape_type,
+    get_shape_converter,
     run_model_validator,
 ):
-    convert_to_shape_type.return_value = sentinel.convert_to_shape_type
+    converter = get_shape_converter.return_value
+    converter.return_value = sentinel.converter
 
     validator = main.create_field_validator(
         sentinel.model_field,
@@ -382,12 +389,25 @@ def test_create_field_validator_no_apply_field_validator(
         value=sentinel.value,
     )
 
-    convert_to_shape_type.assert_called_once_with(
-        sentinel.value,
+    converter.assert_called_once_with(sentinel.value)
+    run_model_validator.assert_not_called()
+    assert result is sentinel.converter
+
+
+@patch.object(main, "get_shape_converter", return_value=None)
+def test_create_field_validator_no_converter(get_shape_converter):
+    validator = main.create_field_validator(
         sentinel.model_field,
+        sentinel.model,
+        apply_model_validators=False,
     )
-    run_model_validator.assert_not_called()
-    assert result is sentinel.convert_to_shape_type
+    result = validator(
+        ctx=sentinel.ctx,
+        param=sentinel.param,
+        value=sentinel.value,
+    )
+
+    assert result is sentinel.value
 
 
 @pytest.mark.parametrize(
@@ -428,6 +448,50 @@ def test_convert_to_shape_type_iter():
     assert tuple(result) == value
 
 
+@pytest.mark.parametrize(
+    "shape, value, expected",
+    (
+        (fields.SHAPE_LIST, (1, 2, 3), [1, 2, 3]),
+        (fields.SHAPE_SET, (1, 2, 3), {1, 2, 3}),
+        (fields.SHAPE_MAPPING, (("a", 1), ("b", 2)), {"a": 1, "b": 2}),
+        (fields.SHAPE_FROZENSET, (1, 2, 3), frozenset((1, 2, 3))),
+        (fields.SHAPE_DEQUE, (1, 2, 3), deque((1, 2, 3))),
+        (fields.SHAPE_DICT, (("a", 1), ("b", 2)), {"a": 1, "b": 2}),
+        (
+            fields.SHAPE_DEFAULTDICT,
+            (("a", 1), ("b", 2)),
+            defaultdict(int, {"a": 1, "b": 2}),
+        ),
+    ),
+)
+def test_get_shape_converter(shape, value, expected):
+    field = MagicMock(spec=fields.ModelField)
+    field.shape = shape
+    field.type_ = int
+
+    result = main.get_shape_converter(field)(value)
+
+    assert result == expected
+
+
+def test_get_shape_converter_unexpected_shape():
+    field = MagicMock(spec=fields.ModelField)
+    field.shape = -1
+
+    assert main.get_shape_converter(field) is None
+
+
+def test_get_shape_converter_iter():
+    field = MagicMock(spec=fields.ModelField)
+    field.shape = fields.SHAPE_ITERABLE
+    value = (1, 2, 3)
+
+    result = main.get_shape_converter(field)(value)
+
+    assert repr(result).startswith("<tuple_iterator object at ")
+    assert tuple(result) == value
+
+
 def test_run_model_validator():
     field = MagicMock(spec=fields.ModelField)
     field.validate.return_value = (sentinel.validated_value, [])
@@ -469,6 +533,8 @@ def test_run_model_validator_error():
         ("str value", "str value"),
         (models.StrEnum.FOO, "foo"),
         ([1, "a", models.StrEnum.BAR], [1, "a", "bar"]),
+        ((1, "a", 1.5), [1, "a", 1.5]),
+        ([[models.StrEnum.BAR], None], [["bar"], None]),
     ),
 )
 def test_convert_default(value, expected):
@@ -528,3 +594,115 @@ def test_calculate_fields(include, exclude, expected):
         exclude=exclude,
     )
     assert result == expected
+
+
+def test_calculate_fields_cached():
+    first = main.calculate_fields(models.MainTestModel, include={"int_val"})
+    second = main.calculate_fields(models.MainTestModel, include={"int_val"})
+
+    assert first == ("int_val",)
+    assert first is second
+
+
+@patch.object(
+    main,
+    "option_from_model_field",
+    return_value=MagicMock(side_effect=lambda x: x),
+)
+def test_options_from_model_cached(option_from_model_field):
+    model = models.MainTestModel
+    field_count = len(model.__fields__)
+
+    main.options_from_model(model, bool_as_flag=False)(MagicMock())
+    main.options_from_model(model, bool_as_flag=False)(MagicMock())
+    assert option_from_model_field.call_count == field_count
+
+    main.options_from_model(model, bool_as_flag=True)(MagicMock())
+    assert option_from_model_field.call_count == field_count * 2
+
+    # the same field names in any collection share cached options
+    main.options_from_model(model, include={"int_val"})(MagicMock())
+    main.options_from_model(model, include=["int_val"])(MagicMock())
+    main.options_from_model(model, include=("int_val",))(MagicMock())
+    assert option_from_model_field.call_count == field_count * 2 + 1
+
+    # unhashable option kwargs are not cached
+    main.options_from_model(model, default=[])(MagicMock())
+    main.options_from_model(model, default=[])(MagicMock())
+    assert option_from_model_field.call_count == field_count * 4 + 1
+
+    # equal containers of different values are not cached
+    main.options_from_model(model, default=(1,))(MagicMock())
+    main.options_from_model(model, default=(True,))(MagicMock())
+    assert option_from_model_field.call_count == field_count * 6 + 1
+
+
+def test_make_option_key_non_ascii():
+    result = main.make_option_key("Ünicode_Name", click.types.STRING, False)
+    assert result == "--ünicode-name"
+
+
+@pytest.mark.parametrize(
+    "model, field_name, expected",
+    (
+        (models.MainTestModel, "int_val", True),
+        (models.MainTestModel, "list_val", True),
+        (models.TypesTestModel, "union", True),
+        (models.TypesTestModel, "any_", False),
+    ),
+)
+def test_needs_validation(model, field_name, expected):
+    field = model.__fields__[field_name]
+    assert main.needs_validation(field) is expected
+
+
+@patch.object(click, "option")
+@patch.object(main, "_build_field_option", wraps=main._build_field_option)
+def test_option_from_model_field_cached(build_field_option, click_option):
+    model = models.MainTestModel
+
+    main.option_from_model_field("int_val", model)
+    main.option_from_model_field("int_val", model, required=True)
+
+    build_field_option.assert_called_once()
+    assert click_option.call_count == 2
+
+    first, second = click_option.call_args_list
+    assert first.kwargs["required"] is False
+    assert second.kwargs["required"] is True
+    assert first.kwargs["callback"] is second.kwargs["callback"]
+
+
+@patch.object(click, "option")
+def test_option_from_model_field_unhashable_extra_types(click_option):
+    class UnhashableType(click.ParamType):
+        name = "unhashable"
+
+        def __eq__(self, other):
+            return isinstance(other, UnhashableType)
+
+    extra_types = {int: UnhashableType()}
+
+    main.option_from_model_field(
+        "int_val", models.MainTestModel, extra_types=extra_types
+    )
+
+    assert click_option.call_args.kwargs["type"] is extra_types[int]
+
+
+def test_create_field_validator_cached():
+    field = models.MainTestModel.__fields__["int_val"]
+    model = models.MainTestModel
+
+    first = main.create_field_validator(field, model)
+    second = main.create_field_validator(field, model)
+    keyword = main.create_field_validator(
+        field, model, apply_model_validators=True
+    )
+    other = main.create_field_validator(
+        field, model, apply_model_validators=False
+    )
+
+    assert first is second
+    assert keyword is first
+    assert other is not first
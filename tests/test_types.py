@@ -1,20 +1,35 @@
+import copy
+import pickle
 from pathlib import Path
 
 import click
 import pytest
 
+from yappy import types
 from yappy.types import (
     NONE,
     EnumChoice,
     MappingType,
     TupleType,
     UnionType,
+    build_click_composite_type,
+    build_reject_check,
+    get_enum_choice,
+    match_click_type,
     match_click_type_from_field,
 )
 
 from .models import CaseSensitiveEnum, IntEnum, StrEnum, TypesTestModel
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    types._match_click_type_from_field.cache_clear()
+    types._match_single_click_type.cache_clear()
+    types.get_enum_choice.cache_clear()
+    types.get_enum_meta.cache_clear()
+
+
 def compare_click_types(result, expected):
     assert result.__class__ is expected.__class__
     assert result.is_composite == expected.is_composite
@@ -194,6 +209,9 @@ def test_union_type():
     assert union_type.name == "<ANY: <boolean boolean> <integer integer>>"
     assert union_type.arity == 2
 
+    same_names = UnionType([click.Path(), click.STRING, click.Path(True)])
+    assert same_names.name == "<ANY: path text>"
+
     result = union_type.convert(("1", "2"), param=None, ctx=None)
     assert result[0] == 1 and result[0] is not True
     assert result[1] == 2
@@ -212,3 +230,193 @@ def test_union_type():
     match_msg = "different subtypes args count is not supported for UnionType"
     with pytest.raises(TypeError, match=match_msg):
         UnionType([click.BOOL, TupleType([click.INT, click.INT])])
+
+
+def test_match_click_type_from_field_cached():
+    field = TypesTestModel.__fields__["tuple_"]
+
+    first = match_click_type_from_field(field)
+    second = match_click_type_from_field(field)
+    other = match_click_type_from_field(field, extra_types={int: click.STRING})
+
+    assert first is second
+    assert other is not first
+    assert other._subtypes == (click.STRING, click.STRING)
+
+
+class UnhashableType(click.ParamType):
+    name = "unhashable"
+
+    def __eq__(self, other):
+        return isinstance(other, UnhashableType)
+
+
+def test_match_click_type_unhashable_extra_types():
+    unhashable = UnhashableType()
+    extra_types = {int: unhashable}
+
+    for field_name in ("scalar", "tuple_", "mapping"):
+        field = TypesTestModel.__fields__[field_name]
+        match_click_type_from_field(field, extra_types=extra_types)
+
+    field = TypesTestModel.__fields__["scalar"]
+    result = match_click_type_from_field(field, extra_types=extra_types)
+    assert result is unhashable
+
+    assert match_click_type([int], extra_types=extra_types) is unhashable
+
+    result = build_click_composite_type(
+        UnionType, [int, str], extra_types={int: unhashable, str: unhashable}
+    )
+    assert result is unhashable
+
+
+def test_match_click_type_cached():
+    first = match_click_type([StrEnum])
+    second = match_click_type([StrEnum])
+    other = match_click_type([StrEnum], case_sensitive_enums=True)
+
+    assert first is second
+    assert other is not first
+
+
+def test_build_click_composite_type_same_subtypes():
+    assert build_click_composite_type(UnionType, [int, int]) is click.INT
+    result = build_click_composite_type(
+        UnionType, [int, str], extra_types={str: click.INT}
+    )
+    assert result is click.INT
+
+    result = build_click_composite_type(UnionType, [int, str])
+    assert isinstance(result, UnionType)
+
+    result = build_click_composite_type(TupleType, [int, int])
+    assert isinstance(result, TupleType)
+
+
+def test_enum_choice_meta_cached():
+    first = EnumChoice(StrEnum)
+    second = EnumChoice(StrEnum, case_sensitive=True)
+
+    assert first.choices is second.choices
+    assert first._choices_aliaces is second._choices_aliaces
+
+
+def test_click_types_slotted_attributes():
+    assert vars(EnumChoice(StrEnum)) == {}
+
+    for click_type in (
+        TupleType([click.INT, click.STRING]),
+        MappingType(click.INT, click.STRING),
+        UnionType([click.INT, click.STRING]),
+    ):
+        assert "name" not in vars(click_type)
+        assert "_subtypes" not in vars(click_type)
+
+
+def test_enum_choice_token_normalize_func():
+    enum_choice = EnumChoice(StrEnum, case_sensitive=True)
+    ctx = click.Context(click.Command("cli"), token_normalize_func=str.lower)
+
+    result = enum_choice.convert("FOO", param=None, ctx=ctx)
+    assert result is StrEnum.FOO
+
+
+@pytest.mark.parametrize(
+    "click_type, value, expected",
+    (
+        (click.BOOL, "yes", False),
+        (click.BOOL, " Off ", False),
+        (click.BOOL, "2", True),
+        (click.BOOL, True, False),
+        (click.INT, "-1_000", False),
+        (click.INT, " +12 ", False),
+        (click.INT, "1.5", True),
+        (click.INT, "", True),
+        (click.INT, 1, False),
+        (click.FLOAT, " -1_0.5e+3 ", False),
+        (click.FLOAT, "-Infinity", False),
+        (click.FLOAT, "nan", False),
+        (click.FLOAT, "1,5", True),
+        (click.FLOAT, "inf1", True),
+        (click.FLOAT, "", True),
+        (click.FLOAT, 1.5, False),
+        (TupleType([click.INT, click.STRING]), ("1", "a"), False),
+        (TupleType([click.INT, click.STRING]), ("a", "1"), True),
+    ),
+)
+def test_build_reject_check(click_type, value, expected):
+    rejects = build_reject_check(click_type)
+    assert rejects(value) is expected
+
+
+def test_build_reject_check_unknown():
+    assert build_reject_check(click.STRING) is None
+    assert build_reject_check(click.UNPROCESSED) is None
+    assert build_reject_check(EnumChoice(StrEnum)) is None
+    assert build_reject_check(TupleType([click.STRING])) is None
+
+
+def test_composite_types_interned():
+    tuple_type = TupleType([click.INT, click.STRING])
+
+    assert TupleType((click.INT, click.STRING)) is tuple_type
+    assert TupleType([click.STRING, click.INT]) is not tuple_type
+    assert MappingType(click.INT, click.STRING) is not tuple_type
+    assert MappingType(click.INT, click.STRING) is MappingType(
+        click.INT, click.STRING
+    )
+    assert UnionType([click.INT, click.STRING]) is UnionType(
+        [click.INT, click.STRING]
+    )
+
+
+@pytest.mark.parametrize(
+    "click_type, value, expected",
+    (
+        (TupleType([click.INT, click.STRING]), ("1", "2"), (1, "2")),
+        (MappingType(click.INT, click.STRING), ("1", "2"), (1, "2")),
+        (UnionType([click.INT, click.STRING]), "1", 1),
+    ),
+)
+@pytest.mark.parametrize(
+    "copy_func",
+    (copy.copy, copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))),
+)
+def test_composite_types_copy(click_type, value, expected, copy_func):
+    result = copy_func(click_type)
+
+    compare_click_types(result, click_type)
+    assert result.convert(value, param=None, ctx=None) == expected
+
+
+def test_composite_types_from_iterator():
+    # not interned yet
+    path_type = click.Path()
+
+    tuple_type = TupleType(i for i in [click.INT, path_type])
+
+    assert tuple_type is TupleType([click.INT, path_type])
+    assert tuple_type.name == "<integer path>"
+    assert tuple_type.arity == 2
+    assert TupleType([]) is not tuple_type
+
+    union_type = UnionType(i for i in [click.INT, path_type])
+    assert union_type._subtypes == (click.INT, path_type)
+
+
+def test_composite_types_interned_weakly():
+    interned_count = len(types._INTERNED_TYPES)
+
+    for _ in range(10):
+        UnionType([click.Path(), click.STRING])
+
+    assert len(types._INTERNED_TYPES) == interned_count
+
+
+def test_get_enum_choice():
+    enum_choice = get_enum_choice(StrEnum, False)
+
+    assert get_enum_choice(StrEnum, False) is enum_choice
+    assert get_enum_choice(StrEnum, True) is not enum_choice
+    assert get_enum_choice(StrEnum, True).case_sensitive is True
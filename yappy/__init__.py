@@ -1,8 +1,34 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .__version__ import __version__  # noqa: F401 - imported but unused
-from .main import option_from_model_field, options_from_model
+
+
+if TYPE_CHECKING:
+    from .main import option_from_model_field, options_from_model
 
 
 __all__ = (
     "option_from_model_field",
     "options_from_model",
 )
+
+
+# click and pydantic are imported on first access only (PEP 562)
+_LAZY_ATTRS: dict[str, str] = {
+    "option_from_model_field": ".main",
+    "options_from_model": ".main",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
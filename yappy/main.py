@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import string
+import sys
 import warnings
 from collections import defaultdict, deque
-from collections.abc import Callable, Sequence, Set
+from collections.abc import Callable, Collection, Hashable, Sequence
 from enum import Enum
-from functools import wraps
-from typing import Any, Optional, TypeVar, Union, cast
+from functools import lru_cache, partial, wraps
+from typing import (
+    Any,
+    ForwardRef,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import click
 from pydantic import BaseModel, fields
-from pydantic.error_wrappers import ValidationError
+from pydantic.error_wrappers import flatten_errors
+from pydantic.typing import NONE_TYPES
 
-from .types import SCALAR_TYPES, NoneType, match_click_type_from_field
+from .types import (
+    SCALAR_TYPES,
+    SCALAR_TYPES_SET,
+    NoneType,
+    match_click_type_from_field,
+)
 
 
 Func = TypeVar("Func", bound=Callable[..., Any])
@@ -20,16 +35,37 @@ Func = TypeVar("Func", bound=Callable[..., Any])
 __all__ = ()
 
 
-MULTIPLE_VALUES_SHAPES: set[int] = {
-    fields.SHAPE_LIST,
-    fields.SHAPE_SET,
-    fields.SHAPE_TUPLE_ELLIPSIS,
-    fields.SHAPE_SEQUENCE,
-    fields.SHAPE_FROZENSET,
-    fields.SHAPE_ITERABLE,
-    fields.SHAPE_DEQUE,
-    *fields.MAPPING_LIKE_SHAPES,
-}
+MULTIPLE_VALUES_SHAPES: frozenset[int] = frozenset(
+    {
+        fields.SHAPE_LIST,
+        fields.SHAPE_SET,
+        fields.SHAPE_TUPLE_ELLIPSIS,
+        fields.SHAPE_SEQUENCE,
+        fields.SHAPE_FROZENSET,
+        fields.SHAPE_ITERABLE,
+        fields.SHAPE_DEQUE,
+        *fields.MAPPING_LIKE_SHAPES,
+    }
+)
+
+
+def needs_validation(field: fields.ModelField) -> bool:
+    """
+    Returns False if field.validate would return any value as is
+    (e.g. for Any fields), so model validators may be skipped.
+    """
+
+    if field.type_.__class__ is ForwardRef:
+        # validate raises an error about not prepared field
+        return True
+
+    if field.shape != fields.SHAPE_SINGLETON or field.sub_fields:
+        return True
+
+    if field.pre_validators or field.validators or field.post_validators:
+        return True
+
+    return not (field.allow_none or field.type_ in NONE_TYPES)
 
 
 def options_from_model(
@@ -63,15 +99,28 @@ def options_from_model(
     else:
         model_ = model
 
-    def decorator(func: Func) -> Func:
-        field_names = calculate_fields(
-            model_, include=include, exclude=exclude
+    cache_key = None
+
+    if _has_scalar_values(options_kwargs):
+        cache_key = _make_cache_key(
+            model_,
+            include,
+            exclude,
+            apply_model_validators,
+            apply_env_vars,
+            bool_as_flag,
+            case_sensitive_enums,
+            options_kwargs,
         )
 
-        for field_name in reversed(field_names):
-            option = option_from_model_field(
-                field_name,
+    def decorator(func: Func) -> Func:
+        if cache_key is not None:
+            model_options = _get_model_options(*cache_key)
+        else:
+            model_options = _build_model_options(
                 model_,
+                include=include,
+                exclude=exclude,
                 apply_model_validators=apply_model_validators,
                 apply_env_vars=apply_env_vars,
                 bool_as_flag=bool_as_flag,
@@ -79,27 +128,26 @@ def options_from_model(
                 **options_kwargs,
             )
 
+        field_names, options = model_options
+
+        for option in options:
             func = cast("Func", option(func))
 
+        if to_kwarg is None:
+            # options only attach params to func, kwargs are passed as is
+            return func
+
+        kwarg_name: str = to_kwarg
+        collision_message = f"{kwarg_name} already in kwargs"
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if to_kwarg is not None:
-                model_data: dict[str, Any] = {
-                    key: value
-                    for key, value in kwargs.items()
-                    if key in field_names
-                }
-
-                kwargs = {
-                    key: value
-                    for key, value in kwargs.items()
-                    if key not in model_data
-                }
+            model_data, kwargs = _split_kwargs(kwargs, field_names)
 
-                if to_kwarg in kwargs:
-                    warnings.warn(f"{to_kwarg} already in kwargs")
+            if kwarg_name in kwargs:
+                warnings.warn(collision_message, stacklevel=2)
 
-                kwargs[to_kwarg] = model_data
+            kwargs[kwarg_name] = model_data
 
             return func(*args, **kwargs)
 
@@ -108,6 +156,106 @@ def options_from_model(
     return decorator
 
 
+# names of model fields and options to apply
+_ModelOptions = tuple[frozenset[str], tuple[Callable[[Any], Any], ...]]
+
+
+# click.option decorators create a new click.Option on every application,
+# so they are safe to share between decorated functions.
+# Options callbacks refer to the model, so the cache is bounded
+# instead of being weakly keyed by the model.
+@lru_cache(maxsize=256)
+def _get_model_options(
+    model: type[BaseModel],
+    include: Optional[frozenset[str]],
+    exclude: Optional[frozenset[str]],
+    apply_model_validators: bool,
+    apply_env_vars: bool,
+    bool_as_flag: bool,
+    case_sensitive_enums: bool,
+    options_kwargs: frozenset[tuple[str, type[Any], Any]],
+) -> _ModelOptions:
+
+    return _build_model_options(
+        model,
+        include=include,
+        exclude=exclude,
+        apply_model_validators=apply_model_validators,
+        apply_env_vars=apply_env_vars,
+        bool_as_flag=bool_as_flag,
+        case_sensitive_enums=case_sensitive_enums,
+        **{key: value for key, _, value in options_kwargs},
+    )
+
+
+def _build_model_options(
+    model: type[BaseModel],
+    *,
+    include: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
+    **kwargs: Any,
+) -> _ModelOptions:
+
+    field_names = calculate_fields(model, include=include, exclude=exclude)
+
+    options = tuple(
+        option_from_model_field(field_name, model, **kwargs)
+        for field_name in reversed(field_names)
+    )
+
+    return frozenset(field_names), options
+
+
+def _split_kwargs(
+    kwargs: dict[str, Any],
+    field_names: frozenset[str],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+
+    model_data: dict[str, Any] = {}
+    other_kwargs: dict[str, Any] = {}
+
+    # single pass over kwargs
+    for key, value in kwargs.items():
+        if key in field_names:
+            model_data[key] = value
+        else:
+            other_kwargs[key] = value
+
+    return model_data, other_kwargs
+
+
+def _has_scalar_values(kwargs: dict[str, Any]) -> bool:
+    # equal containers may hold values of different types, e.g. (1,) and
+    # (True,), so options are cached for exact scalar values only
+    return all(
+        value is None or type(value) in SCALAR_TYPES_SET
+        for value in kwargs.values()
+    )
+
+
+def _freeze(value: Any) -> Any:
+    # include/exclude field names, their order does not matter
+    if isinstance(value, (set, frozenset, list, tuple)):
+        return frozenset(value)
+
+    if isinstance(value, dict):
+        # value types keep equal values like 1 and True apart
+        return frozenset((k, type(v), v) for k, v in value.items())
+
+    return value
+
+
+def _make_cache_key(*args: Any) -> Optional[tuple[Hashable, ...]]:
+    # arguments may contain unhashable values - such calls are not cached
+    try:
+        key = tuple(_freeze(i) for i in args)
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
 def option_from_model_field(
     field_name: str,
     model: type[BaseModel],
@@ -120,6 +268,79 @@ def option_from_model_field(
     **option_kwargs: Any,
 ) -> Callable[[click.decorators.FC], click.decorators.FC]:
 
+    cache_key = None
+
+    # extra types are rebuilt from the cache key items on a cache miss
+    if isinstance(extra_types, dict):
+        cache_key = _make_cache_key(
+            model,
+            field_name,
+            apply_model_validators,
+            apply_env_vars,
+            bool_as_flag,
+            case_sensitive_enums,
+            extra_types,
+        )
+
+    if cache_key is not None:
+        field_option = _get_field_option(*cache_key)
+    else:
+        field_option = _build_field_option(
+            field_name,
+            model,
+            apply_model_validators=apply_model_validators,
+            apply_env_vars=apply_env_vars,
+            bool_as_flag=bool_as_flag,
+            case_sensitive_enums=case_sensitive_enums,
+            extra_types=extra_types,
+        )
+
+    key, field_option_kwargs = field_option
+
+    return click.option(
+        key,
+        field_name,
+        **{**field_option_kwargs, **option_kwargs},
+    )
+
+
+# option key and option kwargs calculated from model field
+_FieldOption = tuple[str, dict[str, Any]]
+
+
+@lru_cache(maxsize=1024)
+def _get_field_option(
+    model: type[BaseModel],
+    field_name: str,
+    apply_model_validators: bool,
+    apply_env_vars: bool,
+    bool_as_flag: bool,
+    case_sensitive_enums: bool,
+    extra_types: frozenset[tuple[Any, type[Any], Any]],
+) -> _FieldOption:
+
+    return _build_field_option(
+        field_name,
+        model,
+        apply_model_validators=apply_model_validators,
+        apply_env_vars=apply_env_vars,
+        bool_as_flag=bool_as_flag,
+        case_sensitive_enums=case_sensitive_enums,
+        extra_types={key: value for key, _, value in extra_types},
+    )
+
+
+def _build_field_option(
+    field_name: str,
+    model: type[BaseModel],
+    *,
+    apply_model_validators: bool,
+    apply_env_vars: bool,
+    bool_as_flag: bool,
+    case_sensitive_enums: bool,
+    extra_types: dict[Any, Any],
+) -> _FieldOption:
+
     field = model.__fields__[field_name]
 
     click_type = match_click_type_from_field(
@@ -129,38 +350,37 @@ def option_from_model_field(
     )
 
     key = make_option_key(field_name, click_type, bool_as_flag)
+    option_kwargs: dict[str, Any] = {}
 
     if isinstance(click_type, NoneType):
-        option_kwargs.setdefault("is_flag", True)
+        option_kwargs["is_flag"] = True
 
     if field.shape in MULTIPLE_VALUES_SHAPES:
-        option_kwargs.setdefault("multiple", True)
+        option_kwargs["multiple"] = True
 
     default = convert_default(field.default)
     if default is not None:
-        option_kwargs.setdefault("default", default)
-        option_kwargs.setdefault("show_default", True)
+        option_kwargs["default"] = default
+        option_kwargs["show_default"] = True
 
-    option_kwargs.setdefault("required", field.required)
-    option_kwargs.setdefault("type", click_type)
+    option_kwargs["required"] = field.required
+    option_kwargs["type"] = click_type
 
     if field.field_info.description:
-        option_kwargs.setdefault("help", field.field_info.description)
+        option_kwargs["help"] = field.field_info.description
 
     envvar = get_envvar(field, apply_env_vars)
     if envvar is not None:
-        option_kwargs.setdefault("envvar", envvar)
+        option_kwargs["envvar"] = envvar
 
-    validator = create_field_validator(
+    if not needs_validation(field):
+        apply_model_validators = False
+
+    option_kwargs["callback"] = create_field_validator(
         field, model, apply_model_validators=apply_model_validators
     )
-    option_kwargs.setdefault("callback", validator)
 
-    return click.option(
-        key,
-        field_name,
-        **option_kwargs,
-    )
+    return key, option_kwargs
 
 
 def create_field_validator(
@@ -169,16 +389,42 @@ def create_field_validator(
     *,
     apply_model_validators: bool = True,
 ) -> Callable[[click.Context, click.Parameter, Any], Any]:
+    return _create_field_validator(field, model, apply_model_validators)
+
+
+# validator only closes over its arguments, so it can be shared
+@lru_cache(maxsize=1024)
+def _create_field_validator(
+    field: fields.ModelField,
+    model: type[BaseModel],
+    apply_model_validators: bool,
+) -> Callable[[click.Context, click.Parameter, Any], Any]:
+    # shape converter and validation flag are resolved once,
+    # not on every callback call
+    convert = get_shape_converter(field)
+    validate = run_model_validator
+
+    if not apply_model_validators:
+
+        def convert_validator(
+            ctx: click.Context, param: click.Parameter, value: Any
+        ) -> Any:
+
+            if convert is not None:
+                value = convert(value)
+
+            return value
+
+        return convert_validator
+
     def field_validator(
         ctx: click.Context, param: click.Parameter, value: Any
     ) -> Any:
 
-        value = convert_to_shape_type(value, field)
-
-        if apply_model_validators:
-            value = run_model_validator(value, field, model)
+        if convert is not None:
+            value = convert(value)
 
-        return value
+        return validate(value, field, model)
 
     return field_validator
 
@@ -194,11 +440,23 @@ SHAPE_TO_TYPE_MAP: dict[int, Callable[[Any], Any]] = {
 }
 
 
+def get_shape_converter(
+    field: fields.ModelField,
+) -> Optional[Callable[[Any], Any]]:
+
+    converter = SHAPE_TO_TYPE_MAP.get(field.shape)
+
+    if converter is None and field.shape == fields.SHAPE_DEFAULTDICT:
+        converter = partial(defaultdict, field.type_)
+
+    return converter
+
+
 def convert_to_shape_type(value: Any, field: fields.ModelField) -> Any:
-    if field.shape in SHAPE_TO_TYPE_MAP:
-        value = SHAPE_TO_TYPE_MAP[field.shape](value)
-    elif field.shape == fields.SHAPE_DEFAULTDICT:
-        value = defaultdict(field.type_, value)
+    converter = get_shape_converter(field)
+
+    if converter is not None:
+        return converter(value)
 
     return value
 
@@ -211,13 +469,19 @@ def run_model_validator(
     value, errors = field.validate(value, values={}, loc=field.name, cls=model)
 
     if errors:
-        validation_error = ValidationError([errors], model=model)
-        raise click.BadParameter(validation_error.errors()[0]["msg"])
+        # only the first error is reported,
+        # so ValidationError with all errors formatted is not needed
+        error = next(flatten_errors([errors], model.__config__))
+        raise click.BadParameter(error["msg"])
 
     return value
 
 
 def convert_default(value: Any) -> Any:
+    # exact types only, Enum members may subclass scalar types
+    if value is None or type(value) in SCALAR_TYPES_SET:
+        return value
+
     if isinstance(value, Enum):
         return value.value
 
@@ -225,6 +489,12 @@ def convert_default(value: Any) -> Any:
         return value
 
     if isinstance(value, Sequence):
+        if isinstance(value, (list, tuple)) and all(
+            type(i) in SCALAR_TYPES_SET for i in value
+        ):
+            # nothing to convert in items
+            return list(value)
+
         return [convert_default(i) for i in value]
 
     return value
@@ -236,39 +506,71 @@ def get_envvar(
 ) -> Optional[str]:
 
     if apply_env_vars:
-        env_names = field.field_info.extra.get("env_names") or []
-
-        if env_names:
-            return cast(str, list(env_names)[0])
+        return _get_field_envvar(field)
 
     return None
 
 
+@lru_cache(maxsize=1024)
+def _get_field_envvar(field: fields.ModelField) -> Optional[str]:
+    env_names = field.field_info.extra.get("env_names") or ()
+    return cast("Optional[str]", next(iter(env_names), None))
+
+
 def make_option_key(
     field_name: str,
     click_type: click.types.ParamType,
     bool_as_flag: bool,
 ) -> str:
-    key = field_name.replace("_", "-").lower()
+    return _make_option_key(
+        field_name,
+        bool_as_flag and isinstance(click_type, click.types.BoolParamType),
+    )
+
+
+# lowercase and replace underscores in a single pass
+_OPTION_KEY_TABLE = str.maketrans(
+    f"{string.ascii_uppercase}_", f"{string.ascii_lowercase}-"
+)
+
+
+@lru_cache(maxsize=512)
+def _make_option_key(field_name: str, bool_flag: bool) -> str:
+    if field_name.isascii():
+        key = field_name.translate(_OPTION_KEY_TABLE)
+    else:
+        key = field_name.replace("_", "-").lower()
 
-    if isinstance(click_type, click.types.BoolParamType) and bool_as_flag:
+    if bool_flag:
         key = f"{key}/--no-{key}"
 
-    return f"--{key}"
+    # the same option keys are shared by every command using the model
+    return sys.intern(f"--{key}")
 
 
 def calculate_fields(
     model: type[BaseModel],
     *,
-    include: Optional[set[str]] = None,
-    exclude: Optional[set[str]] = None,
+    include: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
 ) -> tuple[str, ...]:
-    keys: Set[str] = model.__fields__.keys()
-
-    if include is not None:
-        keys &= include
+    return _calculate_fields(
+        model,
+        frozenset(include) if include is not None else None,
+        frozenset(exclude) if exclude is not None else None,
+    )
 
-    if exclude is not None:
-        keys -= exclude
 
-    return tuple(key for key in model.__fields__.keys() if key in keys)
+@lru_cache(maxsize=256)
+def _calculate_fields(
+    model: type[BaseModel],
+    include: Optional[frozenset[str]],
+    exclude: Optional[frozenset[str]],
+) -> tuple[str, ...]:
+    # single pass over fields keeps the model fields order
+    return tuple(
+        key
+        for key in model.__fields__
+        if (include is None or key in include)
+        if (exclude is None or key not in exclude)
+    )
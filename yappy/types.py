@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import sys
+from collections.abc import Callable, Sequence
 from enum import Enum
+from functools import lru_cache, wraps
 from inspect import isclass
 from pathlib import Path
 from typing import Any, Optional, TypeVar, Union, cast
+from weakref import WeakValueDictionary
 
 import click
 from pydantic import DirectoryPath, FilePath, fields
@@ -19,6 +22,9 @@ SCALAR_TYPES: tuple[type[Any], ...] = (
     bytes,
 )
 
+# for hash lookups by exact type
+SCALAR_TYPES_SET: frozenset[type[Any]] = frozenset(SCALAR_TYPES)
+
 
 CLICK_TYPE_ALIACES: dict[Any, click.types.ParamType] = {
     FilePath: click.Path(exists=True, file_okay=False, path_type=Path),
@@ -26,6 +32,46 @@ CLICK_TYPE_ALIACES: dict[Any, click.types.ParamType] = {
 }
 
 
+_ExtraTypeItem = tuple[Any, click.types.ParamType]
+
+# frozenset, or tuple if some of extra types are unhashable
+_ExtraTypesItems = Union[frozenset[_ExtraTypeItem], tuple[_ExtraTypeItem, ...]]
+
+
+def _freeze_extra_types(
+    extra_types: dict[Any, click.types.ParamType],
+) -> _ExtraTypesItems:
+
+    try:
+        return frozenset(extra_types.items())
+    except TypeError:
+        return tuple(extra_types.items())
+
+
+_CachedFunc = TypeVar("_CachedFunc", bound=Callable[..., Any])
+
+
+def _lru_cache_hashable(maxsize: int) -> Callable[[_CachedFunc], _CachedFunc]:
+    # like lru_cache, but calls with unhashable arguments
+    # (e.g. extra types defining __eq__ only) are not cached
+    def decorator(func: _CachedFunc) -> _CachedFunc:
+        cached = lru_cache(maxsize=maxsize)(func)
+
+        @wraps(func)
+        def wrapper(*args: Any) -> Any:
+            try:
+                hash(args)
+            except TypeError:
+                return func(*args)
+
+            return cached(*args)
+
+        wrapper.cache_clear = cached.cache_clear  # type: ignore
+        return cast("_CachedFunc", wrapper)
+
+    return decorator
+
+
 def match_click_type_from_field(
     field: fields.ModelField,
     *,
@@ -33,11 +79,19 @@ def match_click_type_from_field(
     case_sensitive_enums: bool = False,
 ) -> click.types.ParamType:
 
+    return _match_click_type_from_field(
+        field, _freeze_extra_types(extra_types), case_sensitive_enums
+    )
+
+
+@_lru_cache_hashable(maxsize=1024)
+def _match_click_type_from_field(
+    field: fields.ModelField,
+    extra_types_items: _ExtraTypesItems,
+    case_sensitive_enums: bool,
+) -> click.types.ParamType:
+
     types: list[Any]
-    kwargs: dict[Any, Any] = {
-        "extra_types": extra_types,
-        "case_sensitive_enums": case_sensitive_enums,
-    }
 
     if not field.sub_fields:
         if field.shape == fields.SHAPE_TUPLE:
@@ -50,17 +104,22 @@ def match_click_type_from_field(
         types = [field.type_]
 
     elif field.shape in fields.MAPPING_LIKE_SHAPES:
-        return build_mapping_type(field, **kwargs)
+        return _build_mapping_type(
+            field, extra_types_items, case_sensitive_enums
+        )
 
     else:
         types = [
-            match_click_type_from_field(i, **kwargs) for i in field.sub_fields
+            _match_click_type_from_field(
+                i, extra_types_items, case_sensitive_enums
+            )
+            for i in field.sub_fields
         ]
 
     if field.shape == fields.SHAPE_TUPLE:
         return TupleType(types)
 
-    return match_click_type(types, **kwargs)
+    return _match_click_type(types, extra_types_items, case_sensitive_enums)
 
 
 def match_click_type(
@@ -70,15 +129,35 @@ def match_click_type(
     case_sensitive_enums: bool = False,
 ) -> click.types.ParamType:
 
-    kwargs: dict[Any, Any] = {
-        "extra_types": extra_types,
-        "case_sensitive_enums": case_sensitive_enums,
-    }
+    return _match_click_type(
+        types, _freeze_extra_types(extra_types), case_sensitive_enums
+    )
+
+
+def _match_click_type(
+    types: Sequence[Any],
+    extra_types_items: _ExtraTypesItems,
+    case_sensitive_enums: bool,
+) -> click.types.ParamType:
 
     if len(types) > 1:
-        return build_click_composite_type(UnionType, types, **kwargs)
+        return _build_click_composite_type(
+            UnionType, types, extra_types_items, case_sensitive_enums
+        )
+
+    return _match_single_click_type(
+        types[0], extra_types_items, case_sensitive_enums
+    )
+
+
+@_lru_cache_hashable(maxsize=1024)
+def _match_single_click_type(
+    type_: Any,
+    extra_types_items: _ExtraTypesItems,
+    case_sensitive_enums: bool,
+) -> click.types.ParamType:
 
-    type_ = types[0]
+    extra_types = dict(extra_types_items)
 
     if type_ in extra_types:
         return extra_types[type_]
@@ -86,7 +165,7 @@ def match_click_type(
     if type_ in NONE_TYPES:
         return NONE
 
-    if type_ in SCALAR_TYPES:
+    if type_ in SCALAR_TYPES_SET:
         return click.types.convert_type(type_)
 
     if isinstance(type_, click.ParamType):
@@ -94,7 +173,7 @@ def match_click_type(
 
     if isclass(type_) and issubclass(type_, Enum):
         type_ = cast("type[Enum]", type_)
-        return EnumChoice(type_, case_sensitive=case_sensitive_enums)
+        return get_enum_choice(type_, case_sensitive_enums)
 
     if type_ in CLICK_TYPE_ALIACES:
         return CLICK_TYPE_ALIACES[type_]
@@ -108,14 +187,24 @@ def build_mapping_type(
     case_sensitive_enums: bool = False,
 ) -> MappingType:
 
-    kwargs: dict[Any, Any] = {
-        "extra_types": extra_types,
-        "case_sensitive_enums": case_sensitive_enums,
-    }
+    return _build_mapping_type(
+        field, _freeze_extra_types(extra_types), case_sensitive_enums
+    )
+
+
+def _build_mapping_type(
+    field: fields.ModelField,
+    extra_types_items: _ExtraTypesItems,
+    case_sensitive_enums: bool,
+) -> MappingType:
 
     key_field = cast("fields.ModelField", field.key_field)
-    key_type = match_click_type_from_field(key_field, **kwargs)
-    value_type = match_click_type([field.type_], **kwargs)
+    key_type = _match_click_type_from_field(
+        key_field, extra_types_items, case_sensitive_enums
+    )
+    value_type = _match_single_click_type(
+        field.type_, extra_types_items, case_sensitive_enums
+    )
     return MappingType(key_type, value_type)
 
 
@@ -127,14 +216,42 @@ _ClidanticCompositeType = TypeVar(
 def build_click_composite_type(
     click_type: type[_ClidanticCompositeType],
     types: Sequence[Any],
-    **kwargs: Any,
-) -> _ClidanticCompositeType:
+    *,
+    extra_types: dict[Any, click.types.ParamType] = {},
+    case_sensitive_enums: bool = False,
+) -> click.types.ParamType:
+
+    return _build_click_composite_type(
+        click_type,
+        types,
+        _freeze_extra_types(extra_types),
+        case_sensitive_enums,
+    )
+
 
-    subtypes = [match_click_type([i], **kwargs) for i in types]
-    return cast("_ClidanticCompositeType", click_type(subtypes))
+def _build_click_composite_type(
+    click_type: type[_ClidanticCompositeType],
+    types: Sequence[Any],
+    extra_types_items: _ExtraTypesItems,
+    case_sensitive_enums: bool,
+) -> click.types.ParamType:
+
+    subtypes = [
+        _match_single_click_type(i, extra_types_items, case_sensitive_enums)
+        for i in types
+    ]
+
+    # a union of one repeated type behaves exactly like that type
+    first = subtypes[0]
+    if click_type is UnionType and all(i is first for i in subtypes):
+        return first
+
+    return click_type(subtypes)
 
 
 class NoneType(click.types.ParamType):
+    __slots__ = ()
+
     arity = 0
 
     name = ""
@@ -152,18 +269,55 @@ class NoneType(click.types.ParamType):
 NONE = NoneType()
 
 
+_EnumMeta = tuple[tuple[str, ...], dict[str, Enum], dict[str, Enum], bool]
+
+
+@lru_cache(maxsize=256)
+def get_enum_meta(enum: type[Enum]) -> _EnumMeta:
+    # choices, choices aliaces (as is and casefolded)
+    # and whether values differ only by case
+    aliaces: dict[str, Enum] = {}
+    casefold_aliaces: dict[str, Enum] = {}
+    lower_choices: set[str] = set()
+
+    for member in enum:
+        choice = sys.intern(str(member.value))
+        aliaces[choice] = member
+        casefold_aliaces[choice.casefold()] = member
+        lower_choices.add(choice.lower())
+
+    choices = tuple(aliaces)
+    case_sensitive = len(lower_choices) != len(choices)
+
+    return choices, aliaces, casefold_aliaces, case_sensitive
+
+
 class EnumChoice(click.types.Choice):
+    # click.Choice attributes are slotted here as well
+    __slots__ = (
+        "_enum",
+        "_choices_aliaces",
+        "_casefold_choices_aliaces",
+        "choices",
+        "case_sensitive",
+    )
+
     _enum: type[Enum]
     _choices_aliaces: dict[str, Enum]
+    _casefold_choices_aliaces: dict[str, Enum]
 
     def __init__(self, enum: type[Enum], case_sensitive: bool = False) -> None:
         self._enum = enum
-        self._choices_aliaces = {str(i.value): i for i in enum}
 
-        choices = tuple(self._choices_aliaces.keys())
+        (
+            choices,
+            self._choices_aliaces,
+            self._casefold_choices_aliaces,
+            values_case_sensitive,
+        ) = get_enum_meta(enum)
 
         if not case_sensitive:
-            case_sensitive = len(set(map(str.lower, choices))) != len(choices)
+            case_sensitive = values_case_sensitive
 
         super().__init__(choices=choices, case_sensitive=case_sensitive)
 
@@ -177,26 +331,114 @@ class EnumChoice(click.types.Choice):
         if isinstance(value, self._enum):
             return value
 
+        # fast path, click.Choice rebuilds normalized choices on every call
+        if isinstance(value, str) and (
+            ctx is None or ctx.token_normalize_func is None
+        ):
+            if self.case_sensitive:
+                member = self._choices_aliaces.get(value)
+            else:
+                member = self._casefold_choices_aliaces.get(value.casefold())
+
+            if member is not None:
+                return member
+
         value = super().convert(value=value, param=param, ctx=ctx)
         return self._choices_aliaces[value]
 
 
+@lru_cache(maxsize=256)
+def get_enum_choice(enum: type[Enum], case_sensitive: bool) -> EnumChoice:
+    return EnumChoice(enum, case_sensitive=case_sensitive)
+
+
+# composite types with the same subtypes share a single instance,
+# keys hold subtypes ids, which are kept alive by the interned instance
+_INTERNED_TYPES: WeakValueDictionary[
+    tuple[Any, ...], click.types.CompositeParamType
+] = WeakValueDictionary()
+
+
+def _intern_key(
+    cls: type[click.types.CompositeParamType],
+    subtypes: Sequence[click.types.ParamType],
+) -> tuple[Any, ...]:
+    return (cls, *map(id, subtypes))
+
+
+def _get_interned(
+    cls: type[_ClidanticCompositeType],
+    subtypes: tuple[click.types.ParamType, ...],
+) -> _ClidanticCompositeType:
+
+    key = _intern_key(cls, subtypes)
+    instance = _INTERNED_TYPES.get(key)
+
+    if instance is None:
+        # instances are set up here, not in __init__, so subtypes
+        # are consumed only once (they may be passed as an iterator)
+        instance = object.__new__(cls)
+        instance._setup(subtypes)
+        _INTERNED_TYPES[key] = instance
+
+    return cast("_ClidanticCompositeType", instance)
+
+
 class TupleType(click.types.CompositeParamType):
+    # click.ParamType has no __slots__, so instances still get a __dict__,
+    # but the hot attributes below are read through slot descriptors.
+    # Subclasses must declare __slots__ too.
+    __slots__ = (
+        "_subtypes",
+        "name",
+        "_arity",
+        "_converters",
+        "_all_single",
+        "_offsets",
+    )
+
     _subtypes: tuple[click.types.ParamType, ...]
+    _arity: int
+    _converters: tuple[Callable[[Any], Any], ...]
+    _all_single: bool
+    # (start, end, is single value) of subtypes values
+    _offsets: tuple[tuple[int, int, bool], ...]
+
+    def __new__(cls, subtypes: Sequence[click.types.ParamType]) -> TupleType:
+        return _get_interned(cls, tuple(subtypes))
 
     def __init__(self, subtypes: Sequence[click.types.ParamType]):
-        self._subtypes = tuple(subtypes)
+        # set up by __new__
+        pass
 
-    @property
-    # ignore: incompatible signature
-    def name(self) -> str:  # type: ignore
-        subtypes = " ".join(t.name for t in self._subtypes)
-        return f"<{subtypes}>"
+    def _setup(self, subtypes: tuple[click.types.ParamType, ...]) -> None:
+        self._subtypes = subtypes
+
+        # subtypes are immutable, so name and arity are computed only once
+        names = " ".join(t.name for t in self._subtypes)
+        self.name = f"<{names}>"
+        self._arity = sum(i.arity for i in self._subtypes)
+
+        self._converters = tuple(i.__call__ for i in self._subtypes)
+        self._all_single = all(i.arity == 1 for i in self._subtypes)
+
+        offsets: list[tuple[int, int, bool]] = []
+        start = 0
+        for subtype in self._subtypes:
+            end = start + subtype.arity
+            offsets.append((start, end, subtype.arity == 1))
+            start = end
+
+        self._offsets = tuple(offsets)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # copies and pickles are built (and interned) by __new__
+        return self.__class__, (self._subtypes,)
 
     @property
     # ignore: incompatible signature
     def arity(self) -> int:  # type: ignore
-        return sum(i.arity for i in self._subtypes)
+        return self._arity
 
     def convert(
         self,
@@ -208,35 +450,143 @@ class TupleType(click.types.CompositeParamType):
         if not isinstance(value, tuple):
             value = (value,)
 
-        remain_values: list[Any] = list(value)
-        results: list[Any] = []
+        # one value per subtype
+        if self._all_single and len(value) == len(self._converters):
+            return tuple(
+                convert(item) for convert, item in zip(self._converters, value)
+            )
 
-        for subtype in self._subtypes:
-            if subtype.arity == 1:
-                subtype_value = remain_values[0]
-            else:
-                subtype_value = tuple(remain_values[: subtype.arity])
+        return tuple(
+            convert(value[start] if single else value[start:end])
+            for convert, (start, end, single) in zip(
+                self._converters, self._offsets
+            )
+        )
 
-            results.append(subtype(subtype_value))
-            remain_values = remain_values[subtype.arity :]
 
-        return tuple(results)
+class MappingType(TupleType):
+    __slots__ = ()
 
+    def __new__(
+        cls,
+        key_type: click.types.ParamType,
+        value_type: click.types.ParamType,
+    ) -> MappingType:
+        return _get_interned(cls, (key_type, value_type))
 
-class MappingType(TupleType):
     def __init__(
         self,
         key_type: click.types.ParamType,
         value_type: click.types.ParamType,
     ) -> None:
-        self._subtypes = (key_type, value_type)
+        # set up by __new__
+        pass
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, self._subtypes
+
+
+RejectCheck = Callable[[Any], bool]
+
+
+_BOOL_STRINGS: frozenset[str] = frozenset(
+    ("1", "true", "t", "yes", "y", "on", "0", "false", "f", "no", "n", "off")
+)
+
+
+def _rejects_bool(value: Any) -> bool:
+    return isinstance(value, str) and (
+        value.strip().lower() not in _BOOL_STRINGS
+    )
+
+
+def _rejects_int(value: Any) -> bool:
+    if not isinstance(value, str):
+        return False
+
+    digits = value.strip()
+    if digits[:1] in ("+", "-"):
+        digits = digits[1:]
+
+    return not digits.replace("_", "").isdecimal()
+
+
+_FLOAT_WORDS: frozenset[str] = frozenset(("inf", "infinity", "nan"))
+
+_FLOAT_CHARS: frozenset[str] = frozenset("._e+-")
+
+
+def _rejects_float(value: Any) -> bool:
+    if not isinstance(value, str):
+        return False
+
+    number = value.strip().lower()
+
+    if number.lstrip("+-") in _FLOAT_WORDS:
+        return False
+
+    return not number or not all(
+        i.isdecimal() or i in _FLOAT_CHARS for i in number
+    )
+
+
+def build_reject_check(
+    click_type: click.types.ParamType,
+) -> Optional[RejectCheck]:
+    """
+    Returns cheap check which is true only if click_type
+    definitely fails to convert the value (without raising an exception),
+    or None if there is no such check for click_type.
+    """
+
+    if isinstance(click_type, click.types.BoolParamType):
+        return _rejects_bool
+
+    if isinstance(click_type, click.types.IntParamType):
+        return _rejects_int
+
+    if isinstance(click_type, click.types.FloatParamType):
+        return _rejects_float
+
+    if isinstance(click_type, TupleType) and all(
+        i.arity == 1 for i in click_type._subtypes
+    ):
+        checks = [build_reject_check(i) for i in click_type._subtypes]
+        arity = click_type.arity
+
+        if not any(checks):
+            return None
+
+        def rejects_tuple(value: Any) -> bool:
+            if not isinstance(value, tuple) or len(value) != arity:
+                return False
+
+            return any(
+                check is not None and check(item)
+                for check, item in zip(checks, value)
+            )
+
+        return rejects_tuple
+
+    return None
 
 
 class UnionType(click.types.CompositeParamType):
+    __slots__ = ("_subtypes", "name", "_arity", "_reject_checks")
+
     _subtypes: tuple[click.types.ParamType, ...]
+    _arity: int
+    _reject_checks: tuple[Optional[RejectCheck], ...]
+
+    def __new__(cls, subtypes: Sequence[click.types.ParamType]) -> UnionType:
+        return _get_interned(cls, tuple(subtypes))
 
     def __init__(self, subtypes: Sequence[click.types.ParamType]):
-        self._subtypes = tuple(subtypes)
+        # set up by __new__
+        pass
+
+    def _setup(self, subtypes: tuple[click.types.ParamType, ...]) -> None:
+        self._subtypes = subtypes
 
         if len(self._subtypes) < 2:
             raise ValueError("at least two subtype are required")
@@ -246,18 +596,26 @@ class UnionType(click.types.CompositeParamType):
                 "different subtypes args count is not supported for UnionType"
             )
 
-    @property
-    # ignore: incompatible signature
-    def name(self) -> str:  # type: ignore
-        names = [t.name for t in self._subtypes]
-        uniq_names = set(names)
-        subtypes = " ".join(sorted(uniq_names, key=lambda x: names.index(x)))
-        return f"<ANY: {subtypes}>"
+        # ordered dedup of subtypes names
+        subtypes_names = " ".join(
+            dict.fromkeys(t.name for t in self._subtypes)
+        )
+        self.name = f"<ANY: {subtypes_names}>"
+        self._arity = self._subtypes[0].arity
+
+        # last subtype is always tried to raise its error
+        self._reject_checks = tuple(
+            build_reject_check(i) for i in self._subtypes[:-1]
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # copies and pickles are built (and interned) by __new__
+        return self.__class__, (self._subtypes,)
 
     @property
     # ignore: incompatible signature
     def arity(self) -> int:  # type: ignore
-        return self._subtypes[0].arity
+        return self._arity
 
     def convert(
         self,
@@ -266,10 +624,16 @@ class UnionType(click.types.CompositeParamType):
         ctx: Optional[click.Context],
     ) -> Any:
 
-        for subtype in self._subtypes:
+        # all subtypes but the last one
+        for subtype, rejects in zip(self._subtypes, self._reject_checks):
+            if rejects is not None and rejects(value):
+                continue
+
             try:
                 return subtype(value)
-            except click.BadParameter as e:
-                error = e
+            except click.BadParameter:
+                pass
 
-        raise error
+        # error of the last subtype is propagated as is,
+        # without keeping and re-raising caught exceptions
+        return self._subtypes[-1](value)